@@ -7,19 +7,46 @@ Derived from the 8-model deliberation methodology:
 
 Usage:
     python octagon_pipeline.py --motion "Your motion text" --rounds 3 --models 8
+    python octagon_pipeline.py --bench     # compaction timing on 8RoundEachModel.txt
     
     Or as a library:
     from octagon_pipeline import OctagonSession
     session = OctagonSession(motion, definition, n_rounds)
     session.generate_round_prompt(round_num, model_name, prior_synthesis)
     session.archive(full_log, round_logs, code_artifacts)
+    session.cross_pollination_prompt(resolved, remaining, token_budget=8000)
+    
+    Crash-safe runs:
+    session = OctagonSession(motion, definition, journal_path="run.journal")
+    session = OctagonSession.resume("run.journal")   # after a crash
+    
+    Budgeted runs:
+    scheduler = BudgetScheduler(session, SessionBudget(max_credits=200))
+    decision = scheduler.schedule(model_name, prompt, optional=True)
+    session.record_response(model_name, prompt, response, round_num, latency_s, credits)
+    
+    Sweeps:
+    report = render_sweep(load_sweep_table("motions.jsonl"), "sweep.pack")
+    PromptPack("sweep.pack").get(session_id, model_name, "round_1")
 """
 
+import os
+import re
+import csv
+import sys
 import json
+import time
+import math
+import shutil
+import struct
 import hashlib
 import datetime
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Tuple
+import tempfile
+import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict, replace
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -245,7 +272,7 @@ def cross_pollination_template(
 ) -> str:
     resolved_block = "\n".join([f"- {t}" for t in resolved_tensions])
     remain_block = "\n".join([f"{i+1}. {t}" for i, t in enumerate(remaining_tensions)])
-    return f"""<</HISTORY>>
+    return f"""{history_block}
 You have seen Round 3 responses from all {{N}} other frontier models.
 
 SYNTHESIS OF CONVERGENCE:
@@ -266,6 +293,545 @@ NO HEDGING.
 full table"""
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# HISTORY COMPACTION (token-budgeted history_block for cross-pollination)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def estimate_tokens(text: str) -> int:
+    """Cheap local token estimate (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+# Sections copied verbatim into the history block — the model's committed position.
+# Only the statement's first paragraph is verbatim, capped at VERBATIM_MAX_CHARS;
+# anything after it in the section is extracted like ordinary text.
+VERBATIM_SECTIONS = ("CONCLUSION STATEMENT", "CONVERGENCE STATEMENT")
+VERBATIM_MAX_CHARS = 1200
+
+# Relative value of a sentence by the section it appears in (prefix match).
+# Unlisted sections weigh 1.0; a weight of 0.0 excludes the section entirely.
+SECTION_WEIGHTS = {
+    "IDENTIFICATION": 0.0,
+    "IMMEDIATE TOOL CAPABILITIES": 0.0,
+    "RECENT SURPRISE": 0.3,
+    "CHAIN OF THOUGHT": 0.4,
+    "SYNTHESIS OF CONVERGENCE": 0.5,
+    "REMAINING TENSIONS": 0.5,
+    "WHAT I BRING TO THE FRONTIER": 0.6,
+    "TEST CASES": 1.5,
+    "CONCLUSION STATEMENT": 1.5,
+    "CONVERGENCE STATEMENT": 1.5,
+    "FINAL POSITION": 2.0,
+}
+
+_HEADER_RE = re.compile(r"^(?P<title>[A-Z][A-Z0-9 /&'(),.\-—]{3,}?)\s*(?::\s*(?P<rest>.*))?$")
+# Unindented only: indented copies are echoes of REGISTRATION_TEMPLATE
+_MODEL_NAME_RE = re.compile(r"^\**Model Name:\**\s*(?P<name>[^\[\s].*?)\s*$")
+_IDENTIFICATION_RE = re.compile(r"^[<#*]*(?:HISTORY>>)?\s*\**IDENTIFICATION\**\s*$")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"(\[])")
+_WORD_RE = re.compile(r"[a-z0-9]{4,}")
+_CODE_RE = re.compile(r"[=(){}\[\]]|^\s*(def|class|import|from|return)\b")
+_SEGMENT_BREAK = "full table"
+
+
+@dataclass
+class HistoryCompaction:
+    """Result of compacting round logs into a cross-pollination history_block."""
+    block: str
+    token_budget: int
+    source_tokens: int
+    block_tokens: int
+    units_total: int = 0
+    units_kept: int = 0
+    duplicates_dropped: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Source tokens per block token (higher = more compact)."""
+        return self.source_tokens / max(self.block_tokens, 1)
+
+    @property
+    def over_budget(self) -> bool:
+        """True only when the verbatim statements alone exceed the budget."""
+        return self.block_tokens > self.token_budget
+
+
+@dataclass
+class _Unit:
+    """One extractable piece of a round log (sentence, bullet or verbatim section)."""
+    round_num: int
+    model: str
+    section: str
+    text: str
+    order: int
+    verbatim: bool = False
+    weight: float = 1.0
+    is_code: bool = False
+    score: float = 0.0
+    cost: int = 0
+
+
+def _section_weight(section: str) -> float:
+    for prefix, weight in SECTION_WEIGHTS.items():
+        if section.startswith(prefix):
+            return weight
+    return 1.0
+
+
+def _strip_chunk_header(log_text: str) -> str:
+    """Drop the '# Round N Complete ... # ---' header written by archive_to_rlm."""
+    if log_text.startswith("# ") and "\n# ---" in log_text:
+        return log_text.split("\n# ---", 1)[1]
+    return log_text
+
+
+def _split_models(log_text: str) -> List[Tuple[str, str]]:
+    """
+    Split a round log into (model_name, text) segments.
+    
+    A new segment starts at each 'full table' marker, each IDENTIFICATION
+    header, and each 'Model Name:' line naming a different model than the
+    current segment. Segments without a Model Name fall back to a short first
+    line (the model label pasted after 'full table'), else "unattributed".
+    """
+    segments: List[List] = [[None, []]]          # [name, lines]
+    for line in _strip_chunk_header(log_text).splitlines():
+        current = segments[-1]
+        if line.strip() == _SEGMENT_BREAK:
+            segments.append([None, []])
+            continue
+        if "IDENTIFICATION" in line and _IDENTIFICATION_RE.match(line):
+            if any(l.strip() for l in current[1]):
+                segments.append([None, []])
+            segments[-1][1].append(line)
+            continue
+        match = _MODEL_NAME_RE.match(line) if "Model Name:" in line else None
+        if match:
+            name = match.group("name").strip()
+            if current[0] is None:
+                current[0] = name
+            elif current[0] != name:
+                segments.append([name, []])
+        segments[-1][1].append(line)
+
+    named = []
+    for name, lines in segments:
+        seg = "\n".join(lines)
+        if not seg.strip():
+            continue
+        if name is None:
+            first = seg.strip().splitlines()[0].strip()
+            name = first if len(first) <= 40 and not _HEADER_RE.match(first) else "unattributed"
+        named.append((name, seg))
+    return named
+
+
+def _extract_units(
+    round_num: int,
+    model: str,
+    text: str,
+    start: int,
+    seen: Optional[set] = None,
+) -> Tuple[List[_Unit], int]:
+    """
+    Break one model's response into section-tagged sentence units.
+    
+    Non-verbatim text already in `seen` for this (round, model) is skipped
+    before a unit is built; returns (units, skipped_count).
+    """
+    seen = set() if seen is None else seen
+    skipped = 0
+    units: List[_Unit] = []
+    section = ""
+    weight = 1.0
+    verbatim_lines: Optional[List[str]] = None
+    order = start
+
+    def flush_verbatim():
+        nonlocal verbatim_lines, order
+        if verbatim_lines is not None:
+            body = "\n".join(verbatim_lines).strip()
+            if body:
+                units.append(_Unit(round_num, model, section, body, order, verbatim=True))
+                order += 1
+        verbatim_lines = None
+
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        # Cheap prefilter: headers start with two upper-case characters
+        header = _HEADER_RE.match(line) if line[:2].isupper() else None
+        if header:
+            flush_verbatim()
+            section = header.group("title").strip()
+            weight = _section_weight(section)
+            rest = header.group("rest") or ""
+            if section.startswith(VERBATIM_SECTIONS):
+                verbatim_lines = [rest] if rest else []
+                continue
+            line = rest
+            if not line:
+                continue
+        if verbatim_lines is not None:
+            if not line.strip():
+                if any(l.strip() for l in verbatim_lines):
+                    flush_verbatim()
+                continue
+            if sum(len(l) + 1 for l in verbatim_lines) + len(line) > VERBATIM_MAX_CHARS:
+                flush_verbatim()
+            else:
+                verbatim_lines.append(line)
+                continue
+        if weight == 0.0 or not line.strip():
+            continue
+        if (round_num, model, line) in seen:
+            skipped += 1
+            continue
+        seen.add((round_num, model, line))
+        is_code = _CODE_RE.search(line) is not None
+        pieces = [line] if is_code else _SENTENCE_RE.split(line.strip())
+        for piece in pieces:
+            piece = piece.rstrip()
+            if piece.strip():
+                units.append(_Unit(round_num, model, section, piece, order,
+                                   weight=weight, is_code=is_code))
+                order += 1
+    flush_verbatim()
+    return units, skipped
+
+
+def _render_history(
+    units: List[_Unit],
+    round_convergences: Dict[int, List[str]],
+    round_tensions: Dict[int, List[str]],
+) -> str:
+    lines = ["<<HISTORY>>"]
+    rounds = sorted(set(round_convergences) | set(round_tensions) | {u.round_num for u in units})
+    by_round: Dict[int, List[_Unit]] = {}
+    for u in units:
+        by_round.setdefault(u.round_num, []).append(u)
+    for r in rounds:
+        lines.append(f"=== ROUND {r} ===")
+        if round_convergences.get(r):
+            lines.append("RECORDED CONVERGENCES:")
+            lines.extend(f"- {c}" for c in round_convergences[r])
+        if round_tensions.get(r):
+            lines.append("RECORDED TENSIONS:")
+            lines.extend(f"{i+1}. {t}" for i, t in enumerate(round_tensions[r]))
+        model, section = None, None
+        for u in sorted(by_round.get(r, []), key=lambda u: u.order):
+            if u.model != model:
+                model, section = u.model, None
+                lines.append(f"[{model}]")
+            if u.section != section:
+                section = u.section
+                if section:
+                    lines.append(section)
+            lines.append(u.text)
+    lines.append("<</HISTORY>>")
+    return "\n".join(lines)
+
+
+def compact_history(
+    round_logs: Dict[int, str],
+    round_convergences: Dict[int, List[str]],
+    round_tensions: Dict[int, List[str]],
+    token_budget: int,
+    tokenizer: Callable[[str], int] = estimate_tokens,
+) -> HistoryCompaction:
+    """
+    Build a history_block from logged rounds within a token budget.
+    
+    Recorded convergences/tensions and every CONCLUSION / CONVERGENCE STATEMENT
+    are kept verbatim. The remaining budget is filled extractively: sentences
+    are scored by section weight and by how many models share their terms,
+    exact duplicates across models are dropped, and the picks are emitted in
+    their original order.
+    """
+    units: List[_Unit] = []
+    line_seen: set = set()
+    duplicates = 0
+    for r in sorted(round_logs):
+        for model, text in _split_models(round_logs[r]):
+            extracted, skipped = _extract_units(r, model, text, len(units), line_seen)
+            units.extend(extracted)
+            duplicates += skipped
+
+    # Document frequency of terms across model responses. Logs repeat text heavily
+    # (echoed prompts, re-pasted rounds), so word sets are cached per text and
+    # each model response's vocabulary is unioned before counting.
+    word_cache: Dict[str, frozenset] = {}
+    owner_words: Dict[Tuple[int, str], set] = {}
+    word_sets = []
+    for u in units:
+        words = word_cache.get(u.text)
+        if words is None:
+            words = word_cache[u.text] = frozenset(_WORD_RE.findall(u.text.lower()))
+        word_sets.append(words)
+        owner_words.setdefault((u.round_num, u.model), set()).update(words)
+    model_df: Dict[str, int] = {}
+    for words in owner_words.values():
+        for w in words:
+            model_df[w] = model_df.get(w, 0) + 1
+
+    seen = set()
+    required: List[_Unit] = []
+    candidates: List[_Unit] = []
+    for u, words in zip(units, word_sets):
+        if not u.verbatim and len(words) < 3:
+            continue
+        # Every model's own statement is kept; only extractive text dedups across models
+        key = (u.round_num, u.model, u.text) if u.verbatim else words
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        u.cost = tokenizer(u.text) + 1
+        if u.verbatim:
+            required.append(u)
+            continue
+        salience = sum(math.log1p(model_df[w]) for w in words)
+        u.score = u.weight * (0.25 if u.is_code else 1.0) * salience / math.sqrt(len(words))
+        candidates.append(u)
+    candidates.sort(key=lambda u: u.score, reverse=True)
+
+    block = _render_history(required, round_convergences, round_tensions)
+    remaining = token_budget - tokenizer(block)
+    chosen: List[_Unit] = []
+    for u in candidates:
+        if u.cost <= remaining:
+            chosen.append(u)
+            remaining -= u.cost
+
+    # Section/model labels are not costed above; trim lowest scores until it fits
+    block = _render_history(required + chosen, round_convergences, round_tensions)
+    block_tokens = tokenizer(block)
+    while chosen and block_tokens > token_budget:
+        overflow = block_tokens - token_budget
+        while chosen and overflow > 0:
+            overflow -= chosen.pop().cost
+        block = _render_history(required + chosen, round_convergences, round_tensions)
+        block_tokens = tokenizer(block)
+
+    source_tokens = sum(tokenizer(log) for log in round_logs.values()) + sum(
+        tokenizer(item)
+        for items in list(round_convergences.values()) + list(round_tensions.values())
+        for item in items
+    )
+    return HistoryCompaction(
+        block=block,
+        token_budget=token_budget,
+        source_tokens=source_tokens,
+        block_tokens=block_tokens,
+        units_total=len(units) + duplicates,
+        units_kept=len(required) + len(chosen),
+        duplicates_dropped=duplicates,
+    )
+
+
+def full_history_block(round_logs: Dict[int, str]) -> str:
+    """Uncompacted history_block: every round log in order."""
+    body = "\n\n".join(f"=== ROUND {r} ===\n{round_logs[r]}" for r in sorted(round_logs))
+    return f"<<HISTORY>>\n{body}\n<</HISTORY>>"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SESSION JOURNAL (crash-safe append-only log + resume)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SessionJournal:
+    """
+    Append-only JSONL journal of OctagonSession mutations.
+    
+    Each record is written and flushed to the OS immediately, so a crashed
+    process loses nothing. fsync (durability against power loss) is batched
+    every `fsync_every` records, and forced by sync() at the points where
+    losing data is expensive: after each recorded model response, before
+    archiving, and on close.
+    """
+    
+    def __init__(self, path: str, fsync_every: int = 32):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = fsync_every
+        self._fh = open(self.path, "a", encoding="utf-8")
+        self._pending = 0
+    
+    def append(self, op: str, **data) -> None:
+        """Write one record; fsync once the batch is full."""
+        self._fh.write(json.dumps({"op": op, **data}, ensure_ascii=False) + "\n")
+        self._fh.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+    
+    def sync(self) -> None:
+        """Force pending records to disk."""
+        if self._pending and not self._fh.closed:
+            os.fsync(self._fh.fileno())
+        self._pending = 0
+    
+    def close(self) -> None:
+        if not self._fh.closed:
+            self.sync()
+            self._fh.close()
+    
+    @staticmethod
+    def load(path: str) -> List[Dict]:
+        """
+        Read all complete records from a journal.
+        
+        A torn final record (crash mid-write, no trailing newline) is discarded
+        and truncated from the file so that appends after resume start on a
+        clean line. A complete line that does not parse is corruption, not a
+        torn write: ValueError is raised and the file is left untouched.
+        """
+        records = []
+        good_end = 0
+        with open(path, "rb") as fh:
+            for line_no, line in enumerate(fh, 1):
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    raise ValueError(f"{path}: corrupt journal record on line {line_no}")
+                good_end += len(line)
+            size = fh.seek(0, os.SEEK_END)
+        if good_end < size:
+            with open(path, "r+b") as fh:
+                fh.truncate(good_end)
+        return records
+
+
+def prompt_hash(model_name: str, prompt: str) -> str:
+    """Response-cache key for a prompt sent to a given model."""
+    return hashlib.sha256(f"{model_name}\x00{prompt}".encode()).hexdigest()
+
+
+def _profile_from_dict(data: Dict) -> ModelProfile:
+    """Inverse of asdict(ModelProfile) after a JSON round-trip (int keys restored)."""
+    data = dict(data)
+    data["round_positions"] = {int(k): v for k, v in data.get("round_positions", {}).items()}
+    return ModelProfile(**data)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CREDIT LEDGER (tokens / latency / credits per model per round)
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class LedgerEntry:
+    """Usage for one prompt/response pair."""
+    model_name: str
+    round_num: int                     # 0 = registration, n_rounds + 1 = cross-pollination
+    prompt_tokens: int
+    response_tokens: int
+    latency_s: float = 0.0
+    credits: float = 0.0
+    prompt_hash: str = ""
+    timestamp: str = ""
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.response_tokens
+
+
+class CreditLedger:
+    """
+    Per-model, per-round record of token, latency and credit consumption.
+    
+    Token counts come from `tokenizer` (a local estimate by default); swap in
+    a model-specific tokenizer for tighter numbers.
+    """
+    
+    def __init__(self, tokenizer: Callable[[str], int] = estimate_tokens):
+        self.tokenizer = tokenizer
+        self.entries: List[LedgerEntry] = []
+    
+    def measure(
+        self,
+        model_name: str,
+        round_num: int,
+        prompt: str,
+        response: str,
+        latency_s: float = 0.0,
+        credits: float = 0.0,
+    ) -> LedgerEntry:
+        """Tokenize a prompt/response pair into an entry (not yet recorded)."""
+        return LedgerEntry(
+            model_name=model_name,
+            round_num=round_num,
+            prompt_tokens=self.tokenizer(prompt),
+            response_tokens=self.tokenizer(response),
+            latency_s=latency_s,
+            credits=credits,
+            prompt_hash=prompt_hash(model_name, prompt),
+            timestamp=datetime.datetime.utcnow().isoformat(),
+        )
+    
+    def add(self, entry: LedgerEntry) -> None:
+        self.entries.append(entry)
+    
+    @staticmethod
+    def _aggregate(entries: List[LedgerEntry]) -> Dict[str, float]:
+        return {
+            "calls": len(entries),
+            "prompt_tokens": sum(e.prompt_tokens for e in entries),
+            "response_tokens": sum(e.response_tokens for e in entries),
+            "latency_s": sum(e.latency_s for e in entries),
+            "credits": sum(e.credits for e in entries),
+        }
+    
+    def totals(self) -> Dict[str, float]:
+        return self._aggregate(self.entries)
+    
+    def by_model(self) -> Dict[str, Dict[str, float]]:
+        groups: Dict[str, List[LedgerEntry]] = {}
+        for e in self.entries:
+            groups.setdefault(e.model_name, []).append(e)
+        return {name: self._aggregate(es) for name, es in groups.items()}
+    
+    def by_round(self) -> Dict[int, Dict[str, float]]:
+        groups: Dict[int, List[LedgerEntry]] = {}
+        for e in self.entries:
+            groups.setdefault(e.round_num, []).append(e)
+        return {r: self._aggregate(groups[r]) for r in sorted(groups)}
+    
+    def by_model_round(self) -> Dict[str, Dict[int, Dict[str, float]]]:
+        groups: Dict[str, Dict[int, List[LedgerEntry]]] = {}
+        for e in self.entries:
+            groups.setdefault(e.model_name, {}).setdefault(e.round_num, []).append(e)
+        return {
+            name: {r: self._aggregate(rounds[r]) for r in sorted(rounds)}
+            for name, rounds in groups.items()
+        }
+    
+    def averages(self, model_name: Optional[str] = None) -> Dict[str, float]:
+        """Mean response tokens, latency and credits-per-token (model first, then overall)."""
+        entries = [e for e in self.entries if e.model_name == model_name] or self.entries
+        if not entries:
+            return {}
+        tokens = sum(e.total_tokens for e in entries)
+        return {
+            "response_tokens": sum(e.response_tokens for e in entries) / len(entries),
+            "latency_s": sum(e.latency_s for e in entries) / len(entries),
+            "credits_per_token": sum(e.credits for e in entries) / max(tokens, 1),
+        }
+    
+    def to_dict(self) -> Dict:
+        """Archive form: aggregates plus the raw entries."""
+        return {
+            "totals": self.totals(),
+            "by_model": self.by_model(),
+            "by_round": {f"round_{r}": agg for r, agg in self.by_round().items()},
+            "by_model_round": {
+                name: {f"round_{r}": agg for r, agg in rounds.items()}
+                for name, rounds in self.by_model_round().items()
+            },
+            "entries": [asdict(e) for e in self.entries],
+        }
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # OCTAGON SESSION
 # ─────────────────────────────────────────────────────────────────────────────
@@ -291,6 +857,8 @@ class OctagonSession:
         n_rounds: int = 3,
         n_models: int = 8,
         session_id: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        tokenizer: Callable[[str], int] = estimate_tokens,
     ):
         self.motion = motion
         self.definition = definition
@@ -302,6 +870,79 @@ class OctagonSession:
         self.round_convergences: Dict[int, List[str]] = {}
         self.round_tensions: Dict[int, List[str]] = {}
         self.start_time = datetime.datetime.utcnow().isoformat()
+        self.responses: Dict[str, str] = {}
+        self.ledger = CreditLedger(tokenizer)
+        self.journal: Optional[SessionJournal] = None
+        
+        if journal_path is not None:
+            if Path(journal_path).exists() and Path(journal_path).stat().st_size > 0:
+                raise FileExistsError(
+                    f"Journal {journal_path} already exists; use OctagonSession.resume()"
+                )
+            self.journal = SessionJournal(journal_path)
+            self._journal(
+                "session",
+                motion=self.motion,
+                definition=self.definition,
+                n_rounds=self.n_rounds,
+                n_models=self.n_models,
+                session_id=self.session_id,
+                start_time=self.start_time,
+            )
+            self.journal.sync()
+    
+    @classmethod
+    def resume(
+        cls,
+        journal_path: str,
+        tokenizer: Callable[[str], int] = estimate_tokens,
+    ) -> "OctagonSession":
+        """Rebuild a session from its journal and keep appending to it."""
+        records = SessionJournal.load(journal_path)
+        if not records or records[0].get("op") != "session":
+            raise ValueError(f"{journal_path} is not an Octagon session journal")
+        header = records[0]
+        session = cls(
+            motion=header["motion"],
+            definition=header["definition"],
+            n_rounds=header["n_rounds"],
+            n_models=header["n_models"],
+            session_id=header["session_id"],
+            tokenizer=tokenizer,
+        )
+        session.start_time = header["start_time"]
+        for record in records[1:]:
+            session._replay(record)
+        session.journal = SessionJournal(journal_path)
+        return session
+    
+    def _replay(self, record: Dict) -> None:
+        """Apply one journal record (journal detached, so nothing is re-written)."""
+        op = record["op"]
+        if op == "register_model_response":
+            self.register_model_response(record["model_name"], _profile_from_dict(record["profile"]))
+        elif op == "log_round":
+            self.log_round(record["round_num"], record["log_text"])
+        elif op == "extract_convergences":
+            self.extract_convergences(record["round_num"], record["convergences"])
+        elif op == "extract_tensions":
+            self.extract_tensions(record["round_num"], record["tensions"])
+        elif op == "response":
+            self.responses[record["key"]] = record["response"]
+            if "usage" in record:
+                self._apply_usage(LedgerEntry(**record["usage"]))
+        else:
+            raise ValueError(f"Unknown journal op: {op}")
+    
+    def _journal(self, op: str, **data) -> None:
+        if self.journal is not None:
+            self.journal.append(op, **data)
+    
+    def close_journal(self) -> None:
+        """Flush and close the journal, if any."""
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
     
     def registration_prompt(self) -> str:
         """Generate Phase 0 registration prompt."""
@@ -385,32 +1026,181 @@ class OctagonSession:
         resolved_tensions: List[str],
         remaining_tensions: List[str],
         history_block: str = "<<HISTORY>>[All prior rounds included above]<</HISTORY>>",
+        token_budget: Optional[int] = None,
     ) -> str:
-        """Generate cross-pollination prompt after final round."""
+        """
+        Generate cross-pollination prompt after final round.
+        
+        If token_budget is given, history_block is replaced by a compacted
+        history of the logged rounds (see compact_history).
+        """
+        if token_budget is not None:
+            compaction = self.compact_history(token_budget)
+            if compaction.over_budget:
+                warnings.warn(
+                    f"history_block is {compaction.block_tokens} tokens, over the "
+                    f"{token_budget}-token budget: the verbatim statements alone do not fit",
+                    RuntimeWarning,
+                )
+            history_block = compaction.block
         return cross_pollination_template(history_block, resolved_tensions, remaining_tensions)
     
+    def compact_history(
+        self,
+        token_budget: int,
+        tokenizer: Optional[Callable[[str], int]] = None,
+    ) -> HistoryCompaction:
+        """Compact logged rounds + recorded convergences/tensions to a token budget."""
+        return compact_history(
+            self.round_logs,
+            self.round_convergences,
+            self.round_tensions,
+            token_budget,
+            tokenizer or self.ledger.tokenizer,
+        )
+    
     def register_model_response(self, model_name: str, profile: ModelProfile) -> None:
-        """Register a model's Phase 0 registration response."""
+        """
+        Register a model's Phase 0 registration response.
+        
+        If the ledger already has entries for this model (responses recorded
+        before registration, or a re-registration), a copy of the profile is
+        stored with credits_used set to the ledger total; the caller's object
+        is not modified. Otherwise the profile's own credits_used is kept.
+        """
+        ledger_credits = self.ledger.by_model().get(model_name)
+        if ledger_credits is not None:
+            profile = replace(profile, credits_used=ledger_credits["credits"])
         self.models[model_name] = profile
+        self._journal("register_model_response", model_name=model_name, profile=asdict(profile))
     
     def log_round(self, round_num: int, log_text: str) -> None:
         """Store a round's full log."""
         self.round_logs[round_num] = log_text
         self.round_convergences[round_num] = []
         self.round_tensions[round_num] = []
+        self._journal("log_round", round_num=round_num, log_text=log_text)
     
     def extract_convergences(self, round_num: int, convergences: List[str]) -> None:
         """Record convergence points from a round."""
         self.round_convergences[round_num] = convergences
+        self._journal("extract_convergences", round_num=round_num, convergences=convergences)
     
     def extract_tensions(self, round_num: int, tensions: List[str]) -> None:
         """Record unresolved tensions from a round."""
         self.round_tensions[round_num] = tensions
+        self._journal("extract_tensions", round_num=round_num, tensions=tensions)
+    
+    def record_response(
+        self,
+        model_name: str,
+        prompt: str,
+        response: str,
+        round_num: int = 0,
+        latency_s: float = 0.0,
+        credits: float = 0.0,
+    ) -> LedgerEntry:
+        """
+        Cache a model's raw response to a prompt and charge it to the ledger.
+        
+        round_num is 0 for registration and n_rounds + 1 for cross-pollination.
+        Credits are also added to the model's ModelProfile.credits_used.
+        """
+        key = prompt_hash(model_name, prompt)
+        self.responses[key] = response
+        entry = self.ledger.measure(model_name, round_num, prompt, response, latency_s, credits)
+        self._apply_usage(entry)
+        self._journal(
+            "response", key=key, model_name=model_name, response=response, usage=asdict(entry)
+        )
+        if self.journal is not None:
+            self.journal.sync()
+        return entry
+    
+    def _apply_usage(self, entry: LedgerEntry) -> None:
+        self.ledger.add(entry)
+        if entry.model_name in self.models:
+            self.models[entry.model_name].credits_used += entry.credits
+    
+    def cached_response(self, model_name: str, prompt: str) -> Optional[str]:
+        """
+        Return the recorded response for this model/prompt, or None.
+        
+        Check this before calling a model API so a resumed run never pays
+        twice for a prompt that already has an answer.
+        """
+        return self.responses.get(prompt_hash(model_name, prompt))
     
     def generate_chunk_hash(self, content: str) -> str:
         """Generate a content hash for archive verification."""
         return hashlib.md5(content.encode()).hexdigest()[:16]
     
+    def build_rlm_data(
+        self,
+        now: str,
+        key_convergences: List[str],
+        key_divergences: List[str],
+        chunk_index: Dict,
+    ) -> Dict:
+        """Main RLM JSON structure for this session."""
+        return {
+            "_rlm_metadata": {
+                "version": "1.0",
+                "session_id": self.session_id,
+                "created": self.start_time,
+                "last_updated": now,
+            },
+            "deliberation_identity": {
+                "name": f"Octagon Deliberation — {self.session_id}",
+                "exercise_id": self.session_id,
+                "motion": self.motion,
+                "date_start": self.start_time,
+                "date_end": now,
+                "duration_rounds": self.n_rounds,
+                "models_participating": list(self.models.keys()),
+                "focus": self.definition,
+            },
+            "round_summary": {
+                f"round_{r}": {
+                    "convergences": self.round_convergences.get(r, []),
+                    "tensions": self.round_tensions.get(r, []),
+                }
+                for r in range(1, self.n_rounds + 1)
+            },
+            "key_convergences": key_convergences,
+            "key_divergences": key_divergences,
+            "model_profiles": {
+                name: asdict(profile)
+                for name, profile in self.models.items()
+            },
+            "ledger": self.ledger.to_dict(),
+            "chunk_index": chunk_index,
+            "cross_references": {},
+            "query_endpoints": {
+                "by_round": f"Filter chunk_index by round number",
+                "by_model": f"Filter model_profiles by name",
+                "by_convergence": f"Search key_convergences",
+            }
+        }
+    
+    def build_rlm_index(self, now: str, storage_location: str) -> Dict:
+        """Lightweight RLM index entry pointing at storage_location."""
+        return {
+            "rlm_memory_index": {
+                "version": "1.0",
+                "last_updated": now,
+                "memory_id": self.session_id,
+                "storage_location": storage_location,
+                "tags": [
+                    "octagon", self.session_id,
+                    f"{self.n_rounds}-round-deliberation",
+                    f"{self.n_models}-model",
+                ] + [m.lower().replace(" ", "-").replace(".", "") for m in self.models.keys()],
+                "retention": "permanent",
+                "access": "cross_node",
+            }
+        }
+    
     def archive_to_rlm(
         self,
         output_dir: str,
@@ -430,6 +1220,9 @@ class OctagonSession:
         
         Returns the index JSON structure.
         """
+        if self.journal is not None:
+            self.journal.sync()
+        
         out = Path(output_dir)
         out.mkdir(parents=True, exist_ok=True)
         chunks_dir = out / "chunks"
@@ -462,65 +1255,14 @@ class OctagonSession:
             }
         
         # Build main RLM JSON
-        rlm_data = {
-            "_rlm_metadata": {
-                "version": "1.0",
-                "session_id": self.session_id,
-                "created": self.start_time,
-                "last_updated": now,
-            },
-            "deliberation_identity": {
-                "name": f"Octagon Deliberation — {self.session_id}",
-                "exercise_id": self.session_id,
-                "motion": self.motion,
-                "date_start": self.start_time,
-                "date_end": now,
-                "duration_rounds": self.n_rounds,
-                "models_participating": list(self.models.keys()),
-                "focus": self.definition,
-            },
-            "round_summary": {
-                f"round_{r}": {
-                    "convergences": self.round_convergences.get(r, []),
-                    "tensions": self.round_tensions.get(r, []),
-                }
-                for r in range(1, self.n_rounds + 1)
-            },
-            "key_convergences": key_convergences,
-            "key_divergences": key_divergences,
-            "model_profiles": {
-                name: asdict(profile)
-                for name, profile in self.models.items()
-            },
-            "chunk_index": chunk_index,
-            "cross_references": {},
-            "query_endpoints": {
-                "by_round": f"Filter chunk_index by round number",
-                "by_model": f"Filter model_profiles by name",
-                "by_convergence": f"Search key_convergences",
-            }
-        }
+        rlm_data = self.build_rlm_data(now, key_convergences, key_divergences, chunk_index)
         
         # Write main RLM JSON
         rlm_path = out / f"RLM_{self.session_id}.json"
         rlm_path.write_text(json.dumps(rlm_data, indent=2), encoding='utf-8')
         
         # Write index JSON (lightweight)
-        index_data = {
-            "rlm_memory_index": {
-                "version": "1.0",
-                "last_updated": now,
-                "memory_id": self.session_id,
-                "storage_location": str(rlm_path),
-                "tags": [
-                    "octagon", self.session_id,
-                    f"{self.n_rounds}-round-deliberation",
-                    f"{self.n_models}-model",
-                ] + [m.lower().replace(" ", "-").replace(".", "") for m in self.models.keys()],
-                "retention": "permanent",
-                "access": "cross_node",
-            }
-        }
+        index_data = self.build_rlm_index(now, str(rlm_path))
         index_path = out / f"RLM_INDEX_{self.session_id}.json"
         index_path.write_text(json.dumps(index_data, indent=2), encoding='utf-8')
         
@@ -531,6 +1273,538 @@ class OctagonSession:
         return index_data
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# BUDGET SCHEDULER (ledger-driven send / compact / skip / halt)
+# ─────────────────────────────────────────────────────────────────────────────
+
+SEND, COMPACT, SKIP, HALT = "send", "compact", "skip", "halt"
+
+
+@dataclass
+class SessionBudget:
+    """Per-session limits. None = unlimited."""
+    max_tokens: Optional[int] = None
+    max_credits: Optional[float] = None
+    max_latency_s: Optional[float] = None
+    default_response_tokens: int = 2000    # projection before the ledger has data
+    min_history_tokens: int = 512          # below this, compaction is not worth sending
+
+
+@dataclass
+class ScheduleDecision:
+    """What to do with the next prompt, and the prompt to send if any."""
+    action: str
+    prompt: str = ""
+    reason: str = ""
+    projected_tokens: int = 0
+    projected_credits: float = 0.0
+    projected_latency_s: float = 0.0
+
+
+class BudgetScheduler:
+    """
+    Checks each prompt against the session budget before it is sent.
+    
+    Projections use the session ledger: the model's mean response size,
+    latency and credits-per-token so far (falling back to session-wide means,
+    then to SessionBudget.default_response_tokens).
+    """
+    
+    def __init__(self, session: "OctagonSession", budget: SessionBudget):
+        self.session = session
+        self.budget = budget
+    
+    def remaining(self) -> Dict[str, Optional[float]]:
+        """Budget left per dimension (None = unlimited)."""
+        spent = self.session.ledger.totals()
+        b = self.budget
+        return {
+            "tokens": None if b.max_tokens is None
+                else b.max_tokens - spent["prompt_tokens"] - spent["response_tokens"],
+            "credits": None if b.max_credits is None else b.max_credits - spent["credits"],
+            "latency_s": None if b.max_latency_s is None else b.max_latency_s - spent["latency_s"],
+        }
+    
+    def project(self, model_name: str, prompt: str) -> Tuple[int, float, float]:
+        """Projected (tokens, credits, latency_s) for sending prompt to model_name."""
+        avg = self.session.ledger.averages(model_name)
+        response_tokens = avg.get("response_tokens", self.budget.default_response_tokens)
+        tokens = int(self.session.ledger.tokenizer(prompt) + response_tokens)
+        return tokens, tokens * avg.get("credits_per_token", 0.0), avg.get("latency_s", 0.0)
+    
+    def share(self, calls_left: int = 1) -> Dict[str, Optional[float]]:
+        """One call's even share of the remaining budget (None = unlimited)."""
+        calls = max(calls_left, 1)
+        return {k: None if v is None else v / calls for k, v in self.remaining().items()}
+    
+    def _overrun(
+        self, tokens: int, credits: float, latency_s: float, calls_left: int = 1
+    ) -> str:
+        """Name of the first budget share the projection would exceed, or ''."""
+        left = self.share(calls_left)
+        if left["tokens"] is not None and tokens > left["tokens"]:
+            return "tokens"
+        if left["credits"] is not None and credits > left["credits"]:
+            return "credits"
+        if left["latency_s"] is not None and latency_s > left["latency_s"]:
+            return "latency_s"
+        return ""
+    
+    def schedule(
+        self,
+        model_name: str,
+        prompt: str,
+        optional: bool = False,
+        calls_left: int = 1,
+    ) -> ScheduleDecision:
+        """
+        SEND if the prompt fits this call's share of the budget (remaining /
+        calls_left); otherwise SKIP if optional, else HALT.
+        """
+        tokens, credits, latency_s = self.project(model_name, prompt)
+        over = self._overrun(tokens, credits, latency_s, calls_left)
+        if not over:
+            action, reason = SEND, ""
+        elif optional:
+            action, reason = SKIP, f"optional prompt would exceed {over} budget"
+        else:
+            action, reason = HALT, f"prompt would exceed {over} budget"
+        return ScheduleDecision(
+            action, prompt if action == SEND else "", reason, tokens, credits, latency_s
+        )
+    
+    def schedule_cross_pollination(
+        self,
+        model_name: str,
+        resolved_tensions: List[str],
+        remaining_tensions: List[str],
+        calls_left: int = 1,
+    ) -> ScheduleDecision:
+        """
+        Budget one of `calls_left` remaining cross-pollination calls.
+        
+        Both paths use the same per-call allowance — an even share of what is
+        left in every limited dimension — so early calls cannot starve later
+        ones. SEND the full history if it fits that share; otherwise compact
+        the history to it (COMPACT), or HALT if the share leaves less than
+        SessionBudget.min_history_tokens for history.
+        """
+        s = self.session
+        full = s.cross_pollination_prompt(
+            resolved_tensions, remaining_tensions, history_block=full_history_block(s.round_logs)
+        )
+        tokens, credits, latency_s = self.project(model_name, full)
+        over = self._overrun(tokens, credits, latency_s, calls_left)
+        if not over:
+            return ScheduleDecision(SEND, full, "", tokens, credits, latency_s)
+        
+        # Convert every limited dimension of this call's share into a token allowance
+        share = self.share(calls_left)
+        avg = s.ledger.averages(model_name)
+        allowances = []
+        if share["tokens"] is not None:
+            allowances.append(share["tokens"])
+        if share["credits"] is not None and avg.get("credits_per_token"):
+            allowances.append(share["credits"] / avg["credits_per_token"])
+        if share["latency_s"] is not None and latency_s > share["latency_s"]:
+            return ScheduleDecision(
+                HALT, reason="latency budget share exhausted", projected_tokens=tokens,
+                projected_credits=credits, projected_latency_s=latency_s,
+            )
+        if not allowances:
+            # No dimension converts to tokens (e.g. zero credits-per-token so far),
+            # so compaction cannot be sized; the overrun stands
+            return ScheduleDecision(
+                HALT, reason=f"prompt would exceed {over} budget", projected_tokens=tokens,
+                projected_credits=credits, projected_latency_s=latency_s,
+            )
+        
+        frame = s.cross_pollination_prompt(resolved_tensions, remaining_tensions, history_block="")
+        response_tokens = avg.get("response_tokens", self.budget.default_response_tokens)
+        history_budget = int(min(allowances) - s.ledger.tokenizer(frame) - response_tokens)
+        if history_budget < self.budget.min_history_tokens:
+            return ScheduleDecision(
+                HALT, reason=f"history budget {history_budget} below minimum "
+                             f"{self.budget.min_history_tokens}"
+            )
+        compaction = s.compact_history(history_budget)
+        if compaction.over_budget:
+            return ScheduleDecision(
+                HALT, reason=f"verbatim statements need {compaction.block_tokens} tokens, "
+                             f"history budget is {history_budget}"
+            )
+        prompt = s.cross_pollination_prompt(
+            resolved_tensions, remaining_tensions, history_block=compaction.block
+        )
+        tokens, credits, latency_s = self.project(model_name, prompt)
+        return ScheduleDecision(
+            COMPACT, prompt, f"history compacted to {history_budget} tokens",
+            tokens, credits, latency_s,
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BATCH SWEEPS (many sessions → one packed prompt file + bulk archive)
+# ─────────────────────────────────────────────────────────────────────────────
+
+DEFAULT_MODELS = ["GPT-5.2", "Claude", "Gemini", "GLM", "Kimi", "Deepseek", "Llama", "Grok"]
+
+PACK_MAGIC = b"OCTPACK1"
+_PACK_FOOTER = struct.Struct("<Q8s")       # index offset, magic
+
+
+@dataclass
+class SweepRow:
+    """One motion/definition variant in a sweep."""
+    session_id: str
+    motion: str
+    definition: str
+    n_rounds: int = 3
+    models: List[str] = field(default_factory=lambda: list(DEFAULT_MODELS))
+    rounds: List[Dict] = field(default_factory=list)    # round_prompt kwargs for rounds 1..n
+    r1_synthesis: Dict[str, str] = field(default_factory=dict)   # per-model, used in round 2
+    resolved_tensions: List[str] = field(default_factory=list)
+    remaining_tensions: List[str] = field(default_factory=list)
+
+
+def load_sweep_table(path: str) -> Iterator[SweepRow]:
+    """
+    Stream SweepRows from a .jsonl or .csv table.
+    
+    CSV columns match SweepRow fields; `models` is ';'-separated and the
+    list/dict columns (rounds, r1_synthesis, *_tensions) hold JSON.
+    """
+    if str(path).endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as fh:
+            for rec in csv.DictReader(fh):
+                row = {k: v for k, v in rec.items() if v not in (None, "")}
+                if "n_rounds" in row:
+                    row["n_rounds"] = int(row["n_rounds"])
+                if "models" in row:
+                    row["models"] = [m.strip() for m in row["models"].split(";") if m.strip()]
+                for key in ("rounds", "r1_synthesis", "resolved_tensions", "remaining_tensions"):
+                    if key in row:
+                        row[key] = json.loads(row[key])
+                yield SweepRow(**row)
+    else:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield SweepRow(**json.loads(line))
+
+
+def _render_sweep_row(row: SweepRow) -> List[Tuple[str, str, str]]:
+    """All (model, kind, prompt) triples for one session; shared prompts render once."""
+    session = OctagonSession(
+        row.motion, row.definition, row.n_rounds, len(row.models), session_id=row.session_id
+    )
+    shared = {"registration": session.registration_prompt()}
+    per_model: Dict[Tuple[str, Optional[str]], str] = {}
+    out = []
+    for r in range(1, row.n_rounds + 1):
+        spec = dict(row.rounds[r - 1]) if r <= len(row.rounds) else {}
+        if "model_r1_synthesis" in spec:
+            raise ValueError(
+                f"{row.session_id}: round {r} spec sets model_r1_synthesis; "
+                "use SweepRow.r1_synthesis (per model) instead"
+            )
+        spec.setdefault("theme", f"Round {r}")
+        spec.setdefault("questions", [])
+        # Mirrors round_prompt's dispatch: round 2, and generic mid-rounds before
+        # the final one, take the per-model R1 synthesis
+        if row.r1_synthesis and (r == 2 or 1 < r < row.n_rounds):
+            # Identical syntheses share one render
+            for model in row.models:
+                synthesis = row.r1_synthesis.get(model)
+                if (f"round_{r}", synthesis) not in per_model:
+                    per_model[(f"round_{r}", synthesis)] = session.round_prompt(
+                        r, model_r1_synthesis=synthesis, **spec
+                    )
+        else:
+            shared[f"round_{r}"] = session.round_prompt(r, **spec)
+    shared["cross_pollination"] = session.cross_pollination_prompt(
+        row.resolved_tensions, row.remaining_tensions
+    )
+    for model in row.models:
+        for kind, prompt in shared.items():
+            out.append((model, kind, prompt))
+        for (kind, synthesis), prompt in per_model.items():
+            if row.r1_synthesis.get(model) == synthesis:
+                out.append((model, kind, prompt))
+    return out
+
+
+def _render_sweep_chunk(rows: List[SweepRow]) -> List[Tuple[str, List[Tuple[str, str, str]]]]:
+    return [(row.session_id, _render_sweep_row(row)) for row in rows]
+
+
+class PromptPackWriter:
+    """
+    Writes prompts into a single packed file:
+    
+        PACK_MAGIC | prompt bytes ... | JSONL index | footer(index offset, PACK_MAGIC)
+    
+    Identical prompts within a session are stored once and shared by index
+    entries. Index lines are spooled to a temp file, so memory does not grow
+    with the number of prompts. Data goes to `<path>.tmp` and is renamed into
+    place by close(); abort() deletes it, so a failed run never leaves a pack
+    that looks complete.
+    """
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._fh = open(self._tmp_path, "wb")
+        self._fh.write(PACK_MAGIC)
+        self._index = tempfile.TemporaryFile()
+        self.prompts = 0
+        self.unique_prompts = 0
+    
+    def add_session(self, session_id: str, prompts: List[Tuple[str, str, str]]) -> None:
+        stored: Dict[str, Tuple[int, int]] = {}
+        for model, kind, prompt in prompts:
+            digest = hashlib.md5(prompt.encode()).hexdigest()[:16]
+            if digest not in stored:
+                data = prompt.encode("utf-8")
+                stored[digest] = (self._fh.tell(), len(data))
+                self._fh.write(data)
+                self.unique_prompts += 1
+            offset, length = stored[digest]
+            entry = [session_id, model, kind, offset, length, digest]
+            self._index.write(json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.prompts += 1
+    
+    def close(self) -> int:
+        """Append the index and footer; returns the total file size in bytes."""
+        index_offset = self._fh.tell()
+        self._index.seek(0)
+        shutil.copyfileobj(self._index, self._fh)
+        self._index.close()
+        self._fh.write(_PACK_FOOTER.pack(index_offset, PACK_MAGIC))
+        size = self._fh.tell()
+        self._fh.close()
+        os.replace(self._tmp_path, self.path)
+        return size
+    
+    def abort(self) -> None:
+        """Discard the partial pack."""
+        self._index.close()
+        self._fh.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class PromptPack:
+    """Random-access reader for a file written by PromptPackWriter."""
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._fh = open(self.path, "rb")
+        if self._fh.read(len(PACK_MAGIC)) != PACK_MAGIC:
+            raise ValueError(f"{path} is not an Octagon prompt pack")
+        self._fh.seek(-_PACK_FOOTER.size, os.SEEK_END)
+        footer_at = self._fh.tell()
+        self._index_offset, magic = _PACK_FOOTER.unpack(self._fh.read(_PACK_FOOTER.size))
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{path} is truncated (missing footer)")
+        self._fh.seek(self._index_offset)
+        index_bytes = self._fh.read(footer_at - self._index_offset)
+        self.index: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+        for line in index_bytes.splitlines():
+            session_id, model, kind, offset, length, _ = json.loads(line)
+            self.index[(session_id, model, kind)] = (offset, length)
+    
+    def get(self, session_id: str, model: str, kind: str) -> str:
+        """Prompt text for (session_id, model, kind); kind is registration, round_N or cross_pollination."""
+        offset, length = self.index[(session_id, model, kind)]
+        self._fh.seek(offset)
+        return self._fh.read(length).decode("utf-8")
+    
+    def close(self) -> None:
+        self._fh.close()
+
+
+@dataclass
+class SweepReport:
+    """Throughput and size figures for a batch run."""
+    sessions: int
+    prompts: int
+    unique_prompts: int
+    bytes_written: int
+    elapsed_s: float
+    peak_rss_kb: int = 0            # this process
+    peak_child_rss_kb: int = 0      # largest pool worker (0 when rendered in-process)
+
+    @property
+    def sessions_per_second(self) -> float:
+        return self.sessions / max(self.elapsed_s, 1e-9)
+
+
+def _peak_rss_kb() -> Tuple[int, int]:
+    """Peak RSS in KB of (this process, largest reaped child process)."""
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return 0, 0
+    scale = 1024 if sys.platform == "darwin" else 1     # ru_maxrss is bytes on macOS
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale,
+    )
+
+
+def _chunked(rows: Iterable[SweepRow], size: int) -> Iterator[List[SweepRow]]:
+    chunk: List[SweepRow] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def render_sweep(
+    rows: Iterable[SweepRow],
+    pack_path: str,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 16,
+) -> SweepReport:
+    """
+    Render every session × model prompt of a sweep into one packed file.
+    
+    Rows are streamed in chunks to a process pool with a bounded number of
+    chunks in flight, and written in input order, so peak memory depends on
+    max_workers × chunk_size rather than on the sweep size. max_workers=0
+    renders in-process.
+    """
+    start = time.perf_counter()
+    writer = PromptPackWriter(pack_path)
+    sessions = 0
+    chunks = _chunked(rows, chunk_size)
+    
+    def write(results):
+        nonlocal sessions
+        for session_id, prompts in results:
+            writer.add_session(session_id, prompts)
+            sessions += 1
+    
+    try:
+        if max_workers == 0:
+            for chunk in chunks:
+                write(_render_sweep_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                in_flight: deque = deque()
+                window = 2 * (max_workers or os.cpu_count() or 1)
+                for chunk in chunks:
+                    in_flight.append(pool.submit(_render_sweep_chunk, chunk))
+                    if len(in_flight) >= window:
+                        write(in_flight.popleft().result())
+                while in_flight:
+                    write(in_flight.popleft().result())
+    except BaseException:
+        writer.abort()
+        raise
+    size = writer.close()
+    
+    # Workers have exited by now, so RUSAGE_CHILDREN covers them
+    peak_rss, peak_child_rss = _peak_rss_kb()
+    return SweepReport(
+        sessions=sessions,
+        prompts=writer.prompts,
+        unique_prompts=writer.unique_prompts,
+        bytes_written=size,
+        elapsed_s=time.perf_counter() - start,
+        peak_rss_kb=peak_rss,
+        peak_child_rss_kb=peak_child_rss,
+    )
+
+
+def archive_sessions_bulk(
+    completed: Iterable[Tuple[OctagonSession, str, List[str], List[str]]],
+    output_dir: str,
+    name: str = "sweep",
+    overwrite: bool = False,
+) -> SweepReport:
+    """
+    Archive many completed sessions into two files instead of one set per session.
+    
+    `completed` yields (session, full_log, key_convergences, key_divergences).
+    Creates:
+      - RLM_BULK_{name}.jsonl        one RLM record per line, chunk text and full log inline
+      - RLM_INDEX_BULK_{name}.json   index entries; storage_location is "<path>#<byte offset>"
+    
+    Both files are written as `.tmp` and renamed into place only once every
+    session is archived; on failure the temp files are deleted and any earlier
+    archive is left intact. An existing archive of the same name raises
+    FileExistsError unless overwrite=True.
+    """
+    start = time.perf_counter()
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    bulk_path = out / f"RLM_BULK_{name}.jsonl"
+    index_path = out / f"RLM_INDEX_BULK_{name}.json"
+    if not overwrite and (bulk_path.exists() or index_path.exists()):
+        raise FileExistsError(f"Bulk archive '{name}' already exists in {out}; pass overwrite=True")
+    bulk_tmp = bulk_path.with_name(bulk_path.name + ".tmp")
+    index_tmp = index_path.with_name(index_path.name + ".tmp")
+    now = datetime.datetime.utcnow().isoformat() + "Z"
+    
+    try:
+        sessions, size = _write_bulk_archive(completed, bulk_tmp, index_tmp, bulk_path, now)
+    except BaseException:
+        bulk_tmp.unlink(missing_ok=True)
+        index_tmp.unlink(missing_ok=True)
+        raise
+    os.replace(bulk_tmp, bulk_path)
+    os.replace(index_tmp, index_path)
+    
+    peak_rss, peak_child_rss = _peak_rss_kb()
+    return SweepReport(
+        sessions=sessions,
+        prompts=0,
+        unique_prompts=0,
+        bytes_written=size + index_path.stat().st_size,
+        elapsed_s=time.perf_counter() - start,
+        peak_rss_kb=peak_rss,
+        peak_child_rss_kb=peak_child_rss,
+    )
+
+
+def _write_bulk_archive(
+    completed: Iterable[Tuple[OctagonSession, str, List[str], List[str]]],
+    bulk_tmp: Path,
+    index_tmp: Path,
+    bulk_path: Path,
+    now: str,
+) -> Tuple[int, int]:
+    """Stream sessions into the temp bulk/index files; returns (sessions, bulk bytes)."""
+    sessions = 0
+    with open(bulk_tmp, "wb") as bulk, open(index_tmp, "w", encoding="utf-8") as index:
+        index.write('{"rlm_memory_indexes": [\n')
+        for session, full_log, key_convergences, key_divergences in completed:
+            if session.journal is not None:
+                session.journal.sync()
+            chunk_index = {
+                f"{session.session_id}-r{r}-all-models": {
+                    "round": r,
+                    "hash": session.generate_chunk_hash(log),
+                    "text": log,
+                }
+                for r, log in session.round_logs.items()
+            }
+            rlm_data = session.build_rlm_data(now, key_convergences, key_divergences, chunk_index)
+            rlm_data["full_log"] = full_log
+            offset = bulk.tell()
+            bulk.write(json.dumps(rlm_data, ensure_ascii=False).encode("utf-8") + b"\n")
+            entry = session.build_rlm_index(now, f"{bulk_path}#{offset}")
+            index.write((",\n" if sessions else "") + json.dumps(entry))
+            sessions += 1
+        index.write("\n]}\n")
+        return sessions, bulk.tell()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # PIPELINE EXECUTION CHECKLIST (as executable validation)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -647,5 +1921,38 @@ def demo():
     print("\nPipeline ready. Collect model responses, then call session.archive_to_rlm()")
 
 
+def bench_compaction(
+    log_path: str = "8RoundEachModel.txt",
+    n_rounds: int = 3,
+    token_budget: int = 8000,
+    limit_s: float = 1.0,
+) -> Tuple[bool, Dict]:
+    """
+    Time compact_history on a real multi-model log split into n_rounds rounds.
+    
+    Returns (passed, figures); passed is True when compaction finishes under
+    limit_s and the block fits token_budget.
+    """
+    lines = (Path(__file__).parent / log_path).read_text(encoding="utf-8").splitlines()
+    per_round = -(-len(lines) // n_rounds)
+    logs = {
+        r + 1: "\n".join(lines[r * per_round:(r + 1) * per_round]) for r in range(n_rounds)
+    }
+    start = time.perf_counter()
+    compaction = compact_history(logs, {}, {}, token_budget)
+    elapsed = time.perf_counter() - start
+    figures = {
+        "lines": len(lines),
+        "elapsed_s": round(elapsed, 3),
+        "block_tokens": compaction.block_tokens,
+        "compression_ratio": round(compaction.compression_ratio, 1),
+    }
+    return elapsed < limit_s and not compaction.over_budget, figures
+
+
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        passed, figures = bench_compaction()
+        print(f"History compaction {'PASS' if passed else 'FAIL'}: {figures}")
+        sys.exit(0 if passed else 1)
     demo()